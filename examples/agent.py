@@ -749,6 +749,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        nether.execute(main())
+        nether.execute(main(), use_uvloop=True)
     except KeyboardInterrupt:
         print("\nAI Agent System shutting down gracefully")
@@ -121,4 +121,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    nether.execute(main(), use_uvloop=True)
@@ -196,7 +196,7 @@ def main():
 
     # Create and run the application
     app = LoggingDemoApp(configuration=config)
-    nether.execute(app.start())
+    nether.execute(app.start(), use_uvloop=True)
 
 
 if __name__ == "__main__":
@@ -9,13 +9,21 @@ This file demonstrates real-world patterns using the Nether framework including:
 - Circuit breaker patterns
 """
 
+import argparse
+import array
 import asyncio
+import itertools
 import logging
+import math
+import random
+import sys
 import time
-from collections.abc import Awaitable, Callable
+import types
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Any
+from typing import Any, ClassVar
 
 from nether import Application, execute
 from nether.protocol import Command, Event, Message
@@ -36,6 +44,26 @@ class OrderStatus(StrEnum):
     FAILED = "failed"
 
 
+# Status values used when building events, resolved once at import
+_ST_PENDING = OrderStatus.PENDING.value
+_ST_VALIDATED = OrderStatus.VALIDATED.value
+_ST_PAYMENT_PROCESSED = OrderStatus.PAYMENT_PROCESSED.value
+_ST_CANCELLED = OrderStatus.CANCELLED.value
+
+# Mock address shared by all shipments
+_MOCK_SHIP_ADDR: Mapping[str, str] = types.MappingProxyType({"street": "123 Main St", "city": "Anytown"})
+
+# Indices into SystemMonitor.metrics
+M_PROCESSED = 0
+M_FAILED = 1
+M_PAYFAIL = 2
+M_SHIPPED = 3
+
+# Saga steps tracked as bits of an integer mask
+STEP_INVENTORY = 1 << 0
+STEP_PAYMENT = 1 << 1
+
+
 class PaymentStatus(StrEnum):
     PENDING = "pending"
     AUTHORIZED = "authorized"
@@ -74,7 +102,7 @@ class ProcessPayment(Command):
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ShipOrder(Command):
     order_id: str
-    shipping_address: dict = field(default_factory=dict)
+    shipping_address: Mapping[str, str] = field(default_factory=dict)
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -141,7 +169,7 @@ class CompensationRequired(Event):
 
     order_id: str
     failed_step: str
-    compensation_actions: list[str] = field(default_factory=list)
+    compensation_actions: tuple[tuple[str, ...], ...] = ()  # Tagged actions, e.g. ("refund_payment", payment_id)
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -157,91 +185,123 @@ class SystemHealthCheck(Event):
 # ============================================================================= #
 
 
-class OrderProcessingSaga(Module[ProcessOrder | InventoryValidated | PaymentProcessed | PaymentFailed]):
+class TimerWheel:
+    """
+    Groups simulated service delays into fixed-resolution ticks,
+    so that all waiters expiring in the same tick share one loop timer.
+    """
+
+    def __init__(self, resolution: float = 0.01):
+        self.resolution = resolution
+        self._buckets: dict[int, asyncio.Future[None]] = {}
+
+    async def wait(self, delay: float) -> None:
+        """Wait at least `delay` seconds, rounded up to the next tick"""
+        loop = asyncio.get_running_loop()
+        tick = math.ceil((loop.time() + delay) / self.resolution)
+        future = self._buckets.get(tick)
+        if future is None:
+            future = loop.create_future()
+            self._buckets[tick] = future
+            loop.call_at(tick * self.resolution, self._fire, tick)
+        # Shield the shared future so a cancelled waiter does not cancel the others
+        await asyncio.shield(future)
+
+    def _fire(self, tick: int) -> None:
+        future = self._buckets.pop(tick)
+        if not future.done():
+            future.set_result(None)
+
+
+# Shared by all services to simulate processing latency
+_LATENCY = TimerWheel()
+
+
+class OrderProcessingSaga(Module[ProcessOrder | InventoryValidated | PaymentProcessed | PaymentFailed | OrderShipped]):
     """
     Orchestrates the order processing workflow with compensation patterns
     """
 
+    MAX_ORDERS = 65536  # Upper bound on tracked orders, least recently used are evicted
+
     def __init__(self, application: Application):
         super().__init__(application)
-        self.order_states: dict[str, dict] = {}
+        # Order state is kept as parallel mappings keyed by the interned order id
+        self._status: OrderedDict[str, OrderStatus] = OrderedDict()
+        self._billing: dict[str, tuple[str, float]] = {}  # (customer_id, total_amount)
+        self._completed: dict[str, int] = {}
+        self._compensation: dict[str, list[tuple[str, ...]]] = {}  # Track actions for potential rollback
 
     async def handle(
         self,
-        message: ProcessOrder | InventoryValidated | PaymentProcessed | PaymentFailed,
+        message: ProcessOrder | InventoryValidated | PaymentProcessed | PaymentFailed | OrderShipped,
         *,
         handler: Callable[[Message], Awaitable[None]],
         channel: Callable[[], tuple[asyncio.Queue[Any], asyncio.Event]],
     ) -> None:
-        match message:
-            case ProcessOrder():
-                await self._start_order_processing(message, handler)
-            case InventoryValidated():
-                await self._handle_inventory_validation(message, handler)
-            case PaymentProcessed():
-                await self._handle_payment_success(message, handler)
-            case PaymentFailed():
-                await self._handle_payment_failure(message, handler)
+        await self._HANDLERS[type(message)](self, message, handler)
+
+    def _forget(self, order_id: str) -> None:
+        """Drop all state of an order that reached a terminal step."""
+        self._status.pop(order_id, None)
+        self._billing.pop(order_id, None)
+        self._completed.pop(order_id, None)
+        self._compensation.pop(order_id, None)
 
     async def _start_order_processing(
         self, command: ProcessOrder, handler: Callable[[Message], Awaitable[None]]
     ) -> None:
         """Initialize order processing"""
-        self._logger.info(f" Starting order processing for {command.order_id}")
+        self._logger.info(" Starting order processing for %s", command.order_id)
 
         # Initialize order state
-        self.order_states[command.order_id] = {
-            "status": OrderStatus.PENDING,
-            "customer_id": command.customer_id,
-            "items": command.items,
-            "total_amount": command.total_amount,
-            "completed_steps": set(),
-            "compensation_stack": [],  # Track actions for potential rollback
-        }
-
-        # Emit status change event
-        await handler(
-            OrderStatusChanged(order_id=command.order_id, old_status="", new_status=OrderStatus.PENDING.value)
-        )
-
-        # Start inventory validation
-        await handler(ValidateInventory(order_id=command.order_id, items=command.items))
+        order_id = sys.intern(command.order_id)
+        self._status[order_id] = OrderStatus.PENDING
+        self._billing[order_id] = (command.customer_id, command.total_amount)
+        self._completed[order_id] = 0
+        self._compensation[order_id] = []
+        if len(self._status) > self.MAX_ORDERS:
+            self._forget(next(iter(self._status)))
+
+        # Emit status change event and start inventory validation
+        await handler(OrderStatusChanged(order_id=order_id, old_status="", new_status=_ST_PENDING))
+        await handler(ValidateInventory(order_id=order_id, items=command.items))
 
     async def _handle_inventory_validation(
         self, event: InventoryValidated, handler: Callable[[Message], Awaitable[None]]
     ) -> None:
         """Handle inventory validation results"""
         order_id = event.order_id
-        order_state = self.order_states.get(order_id)
+        status = self._status.get(order_id)
 
-        if not order_state:
-            self._logger.error(f"Order {order_id} not found in saga state")
+        if status is None:
+            self._logger.error("Order %s not found in saga state", order_id)
+            return
+        self._status.move_to_end(order_id)
+
+        completed = self._completed[order_id]
+        if completed & STEP_INVENTORY:
+            self._logger.warning("Duplicate inventory validation for order %s ignored", order_id)
             return
 
         if event.valid:
-            self._logger.info(f" Inventory validated for order {order_id}")
-            order_state["completed_steps"].add("inventory_validated")
-            order_state["compensation_stack"].append("release_inventory")
+            self._logger.info(" Inventory validated for order %s", order_id)
+            self._completed[order_id] = completed | STEP_INVENTORY
+            self._compensation[order_id].append(("release_inventory",))
 
-            # Update status and proceed to payment
-            await handler(
-                OrderStatusChanged(
-                    order_id=order_id, old_status=order_state["status"].value, new_status=OrderStatus.VALIDATED.value
-                )
-            )
+            old_status = status.value
+            customer_id, total_amount = self._billing[order_id]
 
-            order_state["status"] = OrderStatus.VALIDATED
+            self._status[order_id] = OrderStatus.VALIDATED
 
-            # Process payment
-            await handler(
-                ProcessPayment(
-                    order_id=order_id, customer_id=order_state["customer_id"], amount=order_state["total_amount"]
-                )
-            )
+            # Update status and proceed to payment
+            await handler(OrderStatusChanged(order_id=order_id, old_status=old_status, new_status=_ST_VALIDATED))
+            await handler(ProcessPayment(order_id=order_id, customer_id=customer_id, amount=total_amount))
         else:
-            self._logger.warning(f" Inventory validation failed for order {order_id}")
+            self._logger.warning(" Inventory validation failed for order %s", order_id)
+            self._forget(order_id)
             await handler(
-                CompensationRequired(order_id=order_id, failed_step="inventory_validation", compensation_actions=[])
+                CompensationRequired(order_id=order_id, failed_step="inventory_validation", compensation_actions=())
             )
 
     async def _handle_payment_success(
@@ -249,32 +309,35 @@ class OrderProcessingSaga(Module[ProcessOrder | InventoryValidated | PaymentProc
     ) -> None:
         """Handle successful payment"""
         order_id = event.order_id
-        order_state = self.order_states.get(order_id)
+        status = self._status.get(order_id)
+
+        if status is None:
+            return
+        self._status.move_to_end(order_id)
 
-        if not order_state:
+        completed = self._completed[order_id]
+        if completed & STEP_PAYMENT or not completed & STEP_INVENTORY:
+            self._logger.warning("Unexpected payment for order %s ignored", order_id)
             return
 
-        self._logger.info(f" Payment processed for order {order_id}: {event.payment_id}")
-        order_state["completed_steps"].add("payment_processed")
-        order_state["compensation_stack"].append(f"refund_payment:{event.payment_id}")
-        order_state["payment_id"] = event.payment_id
+        self._logger.info(" Payment processed for order %s: %s", order_id, event.payment_id)
+        self._completed[order_id] = completed | STEP_PAYMENT
+        self._compensation[order_id].append(("refund_payment", event.payment_id))
+        old_status = status.value
+        self._status[order_id] = OrderStatus.PAYMENT_PROCESSED
 
-        # Update status
+        # Update status and proceed to shipping
         await handler(
             OrderStatusChanged(
                 order_id=order_id,
-                old_status=order_state["status"].value,
-                new_status=OrderStatus.PAYMENT_PROCESSED.value,
+                old_status=old_status,
+                new_status=_ST_PAYMENT_PROCESSED,
             )
         )
-
-        order_state["status"] = OrderStatus.PAYMENT_PROCESSED
-
-        # Proceed to shipping
         await handler(
             ShipOrder(
                 order_id=order_id,
-                shipping_address={"street": "123 Main St", "city": "Anytown"},  # Mock address
+                shipping_address=_MOCK_SHIP_ADDR,
             )
         )
 
@@ -283,22 +346,36 @@ class OrderProcessingSaga(Module[ProcessOrder | InventoryValidated | PaymentProc
     ) -> None:
         """Handle payment failure - trigger compensation"""
         order_id = event.order_id
-        order_state = self.order_states.get(order_id)
+        compensation_stack = self._compensation.get(order_id)
 
-        if not order_state:
+        if compensation_stack is None:
             return
 
-        self._logger.error(f" Payment failed for order {order_id}: {event.reason}")
+        self._logger.error(" Payment failed for order %s: %s", order_id, event.reason)
+        self._forget(order_id)
 
         # Trigger compensation for all completed steps
         await handler(
             CompensationRequired(
                 order_id=order_id,
                 failed_step="payment_processing",
-                compensation_actions=order_state["compensation_stack"].copy(),
+                compensation_actions=tuple(compensation_stack),
             )
         )
 
+    async def _handle_order_shipped(self, event: OrderShipped, handler: Callable[[Message], Awaitable[None]]) -> None:
+        """Release saga state once the order has shipped"""
+        self._forget(event.order_id)
+
+    # Dispatch table from message type to saga step, looked up once per message
+    _HANDLERS: ClassVar[dict[type[Message], Callable[..., Awaitable[None]]]] = {
+        ProcessOrder: _start_order_processing,
+        InventoryValidated: _handle_inventory_validation,
+        PaymentProcessed: _handle_payment_success,
+        PaymentFailed: _handle_payment_failure,
+        OrderShipped: _handle_order_shipped,
+    }
+
 
 # ============================================================================= #
 
@@ -309,6 +386,7 @@ class InventoryService(Module[ValidateInventory]):
     def __init__(self, application: Application):
         super().__init__(application)
         self.failure_rate = 0.2  # 20% failure rate for demonstration
+        self._uniform = random.Random().random  # Bound once, drawn per message
 
     async def handle(
         self,
@@ -317,15 +395,13 @@ class InventoryService(Module[ValidateInventory]):
         handler: Callable[[Message], Awaitable[None]],
         channel: Callable[[], tuple[asyncio.Queue[Any], asyncio.Event]],
     ) -> None:
-        self._logger.info(f" Validating inventory for order {message.order_id}")
+        self._logger.info(" Validating inventory for order %s", message.order_id)
 
         # Simulate processing time
-        await asyncio.sleep(0.3)
+        await _LATENCY.wait(0.3)
 
         # Simulate occasional failures
-        import random
-
-        is_valid = random.random() > self.failure_rate
+        is_valid = self._uniform() > self.failure_rate
 
         unavailable_items = []
         if not is_valid:
@@ -343,10 +419,12 @@ class PaymentService(Module[ProcessPayment]):
     def __init__(self, application: Application):
         super().__init__(application)
         self.failure_count = 0
-        self.last_failure_time = 0
+        self.last_failure_time = 0.0
         self.circuit_open = False
         self.failure_threshold = 3
         self.recovery_time = 5.0  # seconds
+        self._uniform = random.Random().random  # Bound once, drawn per message
+        self._id_counter = itertools.count()
 
     def _should_allow_request(self) -> bool:
         """Circuit breaker logic"""
@@ -354,7 +432,7 @@ class PaymentService(Module[ProcessPayment]):
             return True
 
         # Check if recovery time has passed
-        if time.time() - self.last_failure_time > self.recovery_time:
+        if time.monotonic() - self.last_failure_time > self.recovery_time:
             self.circuit_open = False
             self.failure_count = 0
             self._logger.info(" Circuit breaker reset - allowing requests")
@@ -372,7 +450,7 @@ class PaymentService(Module[ProcessPayment]):
     def _record_failure(self):
         """Record failed operation"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
 
         if self.failure_count >= self.failure_threshold:
             self.circuit_open = True
@@ -390,20 +468,18 @@ class PaymentService(Module[ProcessPayment]):
             await handler(PaymentFailed(order_id=message.order_id, reason="service_unavailable", amount=message.amount))
             return
 
-        self._logger.info(f" Processing payment for order {message.order_id}: ${message.amount}")
+        self._logger.info(" Processing payment for order %s: $%s", message.order_id, message.amount)
 
         try:
             # Simulate payment processing
-            await asyncio.sleep(0.5)
+            await _LATENCY.wait(0.5)
 
             # Simulate occasional failures (30% failure rate)
-            import random
-
-            if random.random() < 0.3:
+            if self._uniform() < 0.3:
                 raise Exception("Payment gateway timeout")
 
             # Success case
-            payment_id = f"pay_{message.order_id}_{int(time.time())}"
+            payment_id = f"pay_{message.order_id}_{next(self._id_counter)}"
             self._record_success()
 
             await handler(
@@ -417,7 +493,7 @@ class PaymentService(Module[ProcessPayment]):
 
         except Exception as e:
             self._record_failure()
-            self._logger.error(f" Payment failed for order {message.order_id}: {str(e)}")
+            self._logger.error(" Payment failed for order %s: %s", message.order_id, e)
 
             await handler(PaymentFailed(order_id=message.order_id, reason=str(e), amount=message.amount))
 
@@ -425,6 +501,10 @@ class PaymentService(Module[ProcessPayment]):
 class ShippingService(Module[ShipOrder]):
     """Handles order shipping"""
 
+    def __init__(self, application: Application):
+        super().__init__(application)
+        self._id_counter = itertools.count()
+
     async def handle(
         self,
         message: ShipOrder,
@@ -432,12 +512,12 @@ class ShippingService(Module[ShipOrder]):
         handler: Callable[[Message], Awaitable[None]],
         channel: Callable[[], tuple[asyncio.Queue[Any], asyncio.Event]],
     ) -> None:
-        self._logger.info(f" Shipping order {message.order_id}")
+        self._logger.info(" Shipping order %s", message.order_id)
 
         # Simulate shipping process
-        await asyncio.sleep(0.4)
+        await _LATENCY.wait(0.4)
 
-        tracking_number = f"TRK{message.order_id}{int(time.time())}"
+        tracking_number = f"TRK{message.order_id}{next(self._id_counter)}"
 
         await handler(
             OrderShipped(order_id=message.order_id, tracking_number=tracking_number, estimated_delivery="2024-01-15")
@@ -457,8 +537,8 @@ class CompensationHandler(Module[CompensationRequired]):
         handler: Callable[[Message], Awaitable[None]],
         channel: Callable[[], tuple[asyncio.Queue[Any], asyncio.Event]],
     ) -> None:
-        self._logger.warning(f"️ Compensation required for order {message.order_id}")
-        self._logger.info(f"Failed step: {message.failed_step}")
+        self._logger.warning("️ Compensation required for order %s", message.order_id)
+        self._logger.info("Failed step: %s", message.failed_step)
 
         # Execute compensation actions in reverse order (LIFO)
         for action in reversed(message.compensation_actions):
@@ -468,21 +548,27 @@ class CompensationHandler(Module[CompensationRequired]):
         await handler(CancelOrder(order_id=message.order_id, reason=f"compensation_after_{message.failed_step}"))
 
     async def _execute_compensation_action(
-        self, action: str, order_id: str, handler: Callable[[Message], Awaitable[None]]
+        self, action: tuple[str, ...], order_id: str, handler: Callable[[Message], Awaitable[None]]
     ) -> None:
         """Execute individual compensation action"""
-        self._logger.info(f" Executing compensation: {action}")
+        self._logger.info(" Executing compensation: %s", action)
+        tag, *args = action
+        await self._ACTIONS[tag](self, order_id, *args)
+
+    async def _release_inventory(self, order_id: str) -> None:
+        # Simulate releasing reserved inventory
+        await _LATENCY.wait(0.1)
+        self._logger.info(" Released inventory for order %s", order_id)
 
-        if action == "release_inventory":
-            # Simulate releasing reserved inventory
-            await asyncio.sleep(0.1)
-            self._logger.info(f" Released inventory for order {order_id}")
+    async def _refund_payment(self, order_id: str, payment_id: str) -> None:
+        # Simulate payment refund
+        await _LATENCY.wait(0.2)
+        self._logger.info(" Refunded payment %s for order %s", payment_id, order_id)
 
-        elif action.startswith("refund_payment:"):
-            payment_id = action.split(":")[1]
-            # Simulate payment refund
-            await asyncio.sleep(0.2)
-            self._logger.info(f" Refunded payment {payment_id} for order {order_id}")
+    _ACTIONS: ClassVar[dict[str, Callable[..., Awaitable[None]]]] = {
+        "release_inventory": _release_inventory,
+        "refund_payment": _refund_payment,
+    }
 
 
 # ============================================================================= #
@@ -493,7 +579,8 @@ class SystemMonitor(Module[OrderStatusChanged | PaymentFailed | OrderShipped]):
 
     def __init__(self, application: Application):
         super().__init__(application)
-        self.metrics = {"orders_processed": 0, "orders_failed": 0, "payments_failed": 0, "orders_shipped": 0}
+        # Orders processed, orders failed, payments failed, orders shipped (see M_* indices)
+        self.metrics = array.array("Q", [0] * 4)
 
     async def handle(
         self,
@@ -502,29 +589,36 @@ class SystemMonitor(Module[OrderStatusChanged | PaymentFailed | OrderShipped]):
         handler: Callable[[Message], Awaitable[None]],
         channel: Callable[[], tuple[asyncio.Queue[Any], asyncio.Event]],
     ) -> None:
-        match message:
-            case OrderStatusChanged():
-                if message.new_status == OrderStatus.PENDING.value:
-                    self.metrics["orders_processed"] += 1
-                elif message.new_status == OrderStatus.CANCELLED.value:
-                    self.metrics["orders_failed"] += 1
-
-            case PaymentFailed():
-                self.metrics["payments_failed"] += 1
-
-            case OrderShipped():
-                self.metrics["orders_shipped"] += 1
+        self._HANDLERS[type(message)](self, message)
 
         # Log metrics periodically
-        if self.metrics["orders_processed"] % 5 == 0 and self.metrics["orders_processed"] > 0:
+        if self.metrics[M_PROCESSED] % 5 == 0 and self.metrics[M_PROCESSED] > 0:
             await self._emit_health_metrics(handler)
 
+    def _on_status_changed(self, message: OrderStatusChanged) -> None:
+        if message.new_status == _ST_PENDING:
+            self.metrics[M_PROCESSED] += 1
+        elif message.new_status == _ST_CANCELLED:
+            self.metrics[M_FAILED] += 1
+
+    def _on_payment_failed(self, message: PaymentFailed) -> None:
+        self.metrics[M_PAYFAIL] += 1
+
+    def _on_order_shipped(self, message: OrderShipped) -> None:
+        self.metrics[M_SHIPPED] += 1
+
+    _HANDLERS: ClassVar[dict[type[Message], Callable[..., None]]] = {
+        OrderStatusChanged: _on_status_changed,
+        PaymentFailed: _on_payment_failed,
+        OrderShipped: _on_order_shipped,
+    }
+
     async def _emit_health_metrics(self, handler: Callable[[Message], Awaitable[None]]) -> None:
         """Emit system health metrics"""
-        total_orders = self.metrics["orders_processed"]
+        total_orders = self.metrics[M_PROCESSED]
         if total_orders > 0:
-            success_rate = 1.0 - (self.metrics["orders_failed"] / total_orders)
-            payment_failure_rate = self.metrics["payments_failed"] / total_orders
+            success_rate = 1.0 - (self.metrics[M_FAILED] / total_orders)
+            payment_failure_rate = self.metrics[M_PAYFAIL] / total_orders
 
             await handler(
                 SystemHealthCheck(
@@ -536,7 +630,9 @@ class SystemMonitor(Module[OrderStatusChanged | PaymentFailed | OrderShipped]):
             )
 
             self._logger.info(
-                f" System Metrics: Success Rate: {success_rate:.2%}, Payment Failure Rate: {payment_failure_rate:.2%}"
+                " System Metrics: Success Rate: %.2f%%, Payment Failure Rate: %.2f%%",
+                success_rate * 100,
+                payment_failure_rate * 100,
             )
 
 
@@ -550,81 +646,100 @@ class EventLogger(Module[OrderStatusChanged | OrderShipped | OrderCancelled | Sy
         handler: Callable[[Message], Awaitable[None]],
         channel: Callable[[], tuple[asyncio.Queue[Any], asyncio.Event]],
     ) -> None:
-        match message:
-            case OrderStatusChanged():
-                self._logger.info(f" Order {message.order_id}: {message.old_status} → {message.new_status}")
+        self._HANDLERS[type(message)](self, message)
 
-            case OrderShipped():
-                self._logger.info(f" Order {message.order_id} shipped with tracking: {message.tracking_number}")
+    def _log_status_changed(self, message: OrderStatusChanged) -> None:
+        self._logger.info(" Order %s: %s → %s", message.order_id, message.old_status, message.new_status)
 
-            case OrderCancelled():
-                self._logger.warning(f" Order {message.order_id} cancelled: {message.reason}")
+    def _log_order_shipped(self, message: OrderShipped) -> None:
+        self._logger.info(" Order %s shipped with tracking: %s", message.order_id, message.tracking_number)
 
-            case SystemHealthCheck():
-                status_emoji = "" if message.status == "healthy" else "️"
-                self._logger.info(
-                    f"{status_emoji} System Health: {message.service_name} - "
-                    f"Status: {message.status}, Error Rate: {message.error_rate:.2%}"
-                )
+    def _log_order_cancelled(self, message: OrderCancelled) -> None:
+        self._logger.warning(" Order %s cancelled: %s", message.order_id, message.reason)
+
+    def _log_health_check(self, message: SystemHealthCheck) -> None:
+        status_emoji = "" if message.status == "healthy" else "️"
+        self._logger.info(
+            "%s System Health: %s - Status: %s, Error Rate: %.2f%%",
+            status_emoji,
+            message.service_name,
+            message.status,
+            message.error_rate * 100,
+        )
+
+    _HANDLERS: ClassVar[dict[type[Message], Callable[..., None]]] = {
+        OrderStatusChanged: _log_status_changed,
+        OrderShipped: _log_order_shipped,
+        OrderCancelled: _log_order_cancelled,
+        SystemHealthCheck: _log_health_check,
+    }
+
+
+class OrderCompletionBarrier(Module[OrderShipped | CancelOrder]):
+    """Signals once every expected order has shipped or been cancelled"""
+
+    def __init__(self, application: Application, expected: int):
+        super().__init__(application)
+        self.remaining = expected
+        self.done = asyncio.Event()
+
+    async def handle(
+        self,
+        message: OrderShipped | CancelOrder,
+        *,
+        handler: Callable[[Message], Awaitable[None]],
+        channel: Callable[[], tuple[asyncio.Queue[Any], asyncio.Event]],
+    ) -> None:
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.done.set()
 
 
 # ============================================================================= #
 
 
+# Process multiple orders to demonstrate different scenarios
+_ORDERS: tuple[ProcessOrder, ...] = (
+    ProcessOrder(
+        order_id="ORD-001", customer_id="CUST-123", items=[{"id": "item1", "name": "Laptop"}], total_amount=999.99
+    ),
+    ProcessOrder(
+        order_id="ORD-002", customer_id="CUST-456", items=[{"id": "item2", "name": "Mouse"}], total_amount=29.99
+    ),
+    ProcessOrder(
+        order_id="ORD-003", customer_id="CUST-789", items=[{"id": "item3", "name": "Keyboard"}], total_amount=89.99
+    ),
+    ProcessOrder(
+        order_id="ORD-004", customer_id="CUST-101", items=[{"id": "item4", "name": "Monitor"}], total_amount=299.99
+    ),
+    ProcessOrder(
+        order_id="ORD-005", customer_id="CUST-202", items=[{"id": "item5", "name": "Webcam"}], total_amount=79.99
+    ),
+)
+
+
 class ECommerceApplication(Application):
+    completion: OrderCompletionBarrier
+    completion_timeout = 30.0  # seconds
+
     async def main(self) -> None:
         self.logger.info("️ Starting E-Commerce Order Processing Demo")
 
-        # Process multiple orders to demonstrate different scenarios
-        orders = [
-            {
-                "order_id": "ORD-001",
-                "customer_id": "CUST-123",
-                "items": [{"id": "item1", "name": "Laptop"}],
-                "total_amount": 999.99,
-            },
-            {
-                "order_id": "ORD-002",
-                "customer_id": "CUST-456",
-                "items": [{"id": "item2", "name": "Mouse"}],
-                "total_amount": 29.99,
-            },
-            {
-                "order_id": "ORD-003",
-                "customer_id": "CUST-789",
-                "items": [{"id": "item3", "name": "Keyboard"}],
-                "total_amount": 89.99,
-            },
-            {
-                "order_id": "ORD-004",
-                "customer_id": "CUST-101",
-                "items": [{"id": "item4", "name": "Monitor"}],
-                "total_amount": 299.99,
-            },
-            {
-                "order_id": "ORD-005",
-                "customer_id": "CUST-202",
-                "items": [{"id": "item5", "name": "Webcam"}],
-                "total_amount": 79.99,
-            },
-        ]
-
         async with self.mediator.context() as ctx:
-            # Process orders with small delays
-            for order_data in orders:
-                await ctx.process(ProcessOrder(**order_data))
-                await asyncio.sleep(0.1)  # Small delay between orders
+            # Submit all orders at once, they are processed independently
+            await asyncio.gather(*(ctx.process(order) for order in _ORDERS))
 
             # Wait for processing to complete
             self.logger.info("⏳ Waiting for order processing to complete...")
-            await asyncio.sleep(8)
+            try:
+                await asyncio.wait_for(self.completion.done.wait(), timeout=self.completion_timeout)
+            except TimeoutError:
+                self.logger.warning("%s orders still in progress after timeout", self.completion.remaining)
 
             self.logger.info(" Demo completed!")
 
 
 async def main():
-    import argparse
-
     configuration = argparse.Namespace()
     configuration.host = "localhost"
     configuration.port = 8083
@@ -643,8 +758,11 @@ async def main():
     application.register_module(SystemMonitor(application))
     application.register_module(EventLogger(application))
 
+    application.completion = OrderCompletionBarrier(application, expected=len(_ORDERS))
+    application.register_module(application.completion)
+
     await application.start()
 
 
 if __name__ == "__main__":
-    execute(main())
+    execute(main(), use_uvloop=True)
@@ -1,7 +1,9 @@
 import asyncio
 import json
+import logging
 import platform
 import time
+import weakref
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
@@ -12,65 +14,135 @@ from nether.modules import Module
 from nether.message import Command, Event, Message
 from nether.server import RegisterView, Server
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional, /status.msgpack is only served when installed
+    msgpack = None
+
+# JSON serializer for all views, chosen once at import
+if orjson is not None:
+
+    def _json_body(obj: Any) -> bytes:
+        """Serialize `obj` to indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+else:
+    _json_encoder = json.JSONEncoder(indent=2)
+
+    def _json_body(obj: Any) -> bytes:
+        """Serialize `obj` to indented JSON bytes."""
+        return _json_encoder.encode(obj).encode()
+
+
+logger = logging.getLogger(__name__)
+
+_NETHER_VERSION = getattr(nether, "__version__", "unknown")
+
+# Platform details do not change while running, platform.processor() may even spawn a subprocess
+_PLATFORM = {
+    "python_version": platform.python_version(),
+    "system": platform.system(),
+    "release": platform.release(),
+    "machine": platform.machine(),
+    "processor": platform.processor(),
+}
+
+# Static per-component metadata, computed on first request and dropped with the component
+_component_info_cache: weakref.WeakKeyDictionary[Module, dict[str, str]] = weakref.WeakKeyDictionary()
+
+
+def _component_info(component: Module) -> dict[str, str]:
+    info = _component_info_cache.get(component)
+    if info is None:
+        info = _component_info_cache[component] = {
+            "name": component.__class__.__name__,
+            "type": f"{type(component).__module__}.{type(component).__qualname__}",
+            "supports": str(component.supports),
+            "state": "running",  # Could be enhanced with actual state
+        }
+    return info
+
 
 class System(nether.Nether):
     def __init__(self, configuration):
         super().__init__(configuration=configuration)
-        self.start_time = time.time()
+        self.start_time = time.time()  # Wall-clock start, reported as is
+        self.start_monotonic = time.monotonic()  # Reference for uptime arithmetic
+        self.producer_stop = asyncio.Event()  # Set directly by a consumer to stop the producer
 
     async def main(self) -> None:
-        print("Started")
+        logger.info("Started")
 
 
 class SystemStatusView(web.View):
     """Web view to display system status and information."""
 
-    async def get(self) -> web.Response:
-        """Handle GET request to show system status."""
-        system: System = self.request.app["system"]
+    @staticmethod
+    def status_sections(system: System) -> dict[str, Any]:
+        """Collect all status sections except the component list."""
         mediator = system.mediator
 
         # Calculate uptime
-        uptime_seconds = time.time() - system.start_time
-        uptime_hours = int(uptime_seconds // 3600)
-        uptime_minutes = int((uptime_seconds % 3600) // 60)
-        uptime_secs = int(uptime_seconds % 60)
-
-        # Get component information
-        components = []
-        for component in mediator.modules:
-            component_info = {
-                "name": component.__class__.__name__,
-                "type": str(type(component).__module__ + "." + type(component).__name__),
-                "supports": str(component.supports),
-                "state": "running",  # Could be enhanced with actual state
-            }
-            components.append(component_info)
-
-        status_data = {
+        uptime_seconds = int(time.monotonic() - system.start_monotonic)
+        uptime_minutes, uptime_secs = divmod(uptime_seconds, 60)
+        uptime_hours, uptime_minutes = divmod(uptime_minutes, 60)
+
+        return {
             "system": {
                 "name": "Nether System",
-                "version": getattr(nether, "__version__", "unknown"),
+                "version": _NETHER_VERSION,
                 "uptime": f"{uptime_hours:02d}:{uptime_minutes:02d}:{uptime_secs:02d}",
-                "uptime_seconds": int(uptime_seconds),
+                "uptime_seconds": uptime_seconds,
                 "start_time": system.start_time,
             },
-            "platform": {
-                "python_version": platform.python_version(),
-                "system": platform.system(),
-                "release": platform.release(),
-                "machine": platform.machine(),
-                "processor": platform.processor(),
-            },
+            "platform": _PLATFORM,
             "mediator": {
                 "component_count": len(mediator.modules),
-                "context_count": len(mediator._contexts),
+                "context_count": mediator.context_count,
             },
-            "components": components,
         }
 
-        # Return JSON response
-        return web.json_response(status_data, dumps=lambda obj: json.dumps(obj, indent=2))
+    async def get(self) -> web.StreamResponse:
+        """Handle GET request to show system status.
+
+        The JSON document is streamed section by section and one component
+        at a time, so the full status is never held in memory at once.
+        """
+        system: System = self.request.app["system"]
+
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(self.request)
+
+        separator = b"{"
+        for key, section in self.status_sections(system).items():
+            await response.write(separator + _json_body(key) + b": " + _json_body(section))
+            separator = b", "
+        await response.write(b', "components": [')
+
+        # Snapshot the modules, the set may change while the response is written
+        separator = b""
+        for component in tuple(system.mediator.modules):
+            await response.write(separator + _json_body(_component_info(component)))
+            separator = b", "
+
+        await response.write_eof(b"]}")
+        return response
+
+
+class SystemStatusMsgpackView(web.View):
+    """Web view to return the system status encoded as MessagePack."""
+
+    async def get(self) -> web.Response:
+        """Handle GET request to show system status in binary form."""
+        system: System = self.request.app["system"]
+        status_data = SystemStatusView.status_sections(system)
+        status_data["components"] = [_component_info(component) for component in tuple(system.mediator.modules)]
+        return web.Response(body=msgpack.packb(status_data, use_bin_type=True), content_type="application/msgpack")
 
 
 class StatusRegistrationComponent(Module[RegisterView]):
@@ -90,9 +162,11 @@ class StatusRegistrationComponent(Module[RegisterView]):
             # Register the system status view
             async with self.application.mediator.context() as ctx:
                 await ctx.process(RegisterView(route="/status", view=SystemStatusView))
+                if msgpack is not None:
+                    await ctx.process(RegisterView(route="/status.msgpack", view=SystemStatusMsgpackView))
 
             self.registered = True
-            print("System status available at: http://localhost:8082/status")
+            self._logger.info("System status available at: http://localhost:8082/status")
 
     async def handle(self, message: RegisterView, *, handler: Callable[[Message], Awaitable[None]], **_: Any) -> None:
         # This component doesn't actually need to handle RegisterView messages
@@ -121,35 +195,41 @@ class Producer(Module[StopProducer]):
     def __init__(self, application: System):
         super().__init__(application)
         self._value = 0
-        self._finish = False
+        self._stop_event = application.producer_stop
         self._task: asyncio.Task | None = None
 
+    BATCH_SIZE = 32  # Events produced within one mediator context
+
     async def main(self):
-        while not self._finish:
-            event = Result(value=self._value)
-            self._value += 1
+        while not self._stop_event.is_set():
             async with self.application.mediator.context() as ctx:
-                await ctx.process(event)
-                if self._finish:
-                    break
-            print(f"Produced {event.value}")
-            await asyncio.sleep(1.0)
-            if self._finish:
-                break
+                for _ in range(self.BATCH_SIZE):
+                    event = Result(value=self._value)
+                    self._value += 1
+                    await ctx.process(event)
+                    if self._stop_event.is_set():
+                        break
+                    self._logger.debug("Produced %d", event.value)
+                    # Wait for the next tick, returning early once a stop is requested
+                    try:
+                        await asyncio.wait_for(self._stop_event.wait(), timeout=1.0)
+                        break
+                    except TimeoutError:
+                        pass
 
     async def on_start(self) -> None:
-        self._finish = False
+        self._stop_event.clear()
         self._task = asyncio.create_task(self.main())
         await super().on_start()
         self._logger.info("Started")
 
     async def on_stop(self) -> None:
-        self._finish = True
+        self._stop_event.set()
         if self._task:
             await self._task
             self._task = None
         await super().on_stop()
-        print(f"{self.__class__.__name__} stopped.")
+        self._logger.info("Stopped")
 
     async def on_error(self) -> None: ...
 
@@ -160,20 +240,21 @@ class Producer(Module[StopProducer]):
         handler: Callable[[Message], Awaitable[None]],
         channel: Callable[[], tuple[asyncio.Queue[Any], asyncio.Event]],
     ) -> None:
-        self._finish = True
+        self._stop_event.set()
 
 
 class Consumer(Module[Result]):
-    def __init__(self, system: System, name: str | None = None):
+    def __init__(self, system: System, name: str | None = None, *, leader: bool = False):
         super().__init__(system)
         self.name = str(type(self)) if name is None else name
+        self._is_leader = leader  # The leader decides when the producer stops
 
     async def on_start(self) -> None:
-        print(f"{self.name} started")
+        self._logger.info("%s started", self.name)
         await super().on_start()
 
     async def on_stop(self) -> None:
-        print(f"{self.name} stopped")
+        self._logger.info("%s stopped", self.name)
         await super().on_stop()
 
     async def handle(
@@ -183,39 +264,43 @@ class Consumer(Module[Result]):
         handler: Callable[[Message], Awaitable[None]],
         channel: Callable[[], tuple[asyncio.Queue[Any], asyncio.Event]],
     ) -> None:
-        print(f"{self.name} consumed {message.value}")
-        # Only one consumer needs to send StopProducer, but all will receive events.
-        if message.value >= 21 and self.name == "Consumer-1":
-            await handler(StopProducer())
+        self._logger.debug("%s consumed %d", self.name, message.value)
+        # Only one consumer needs to stop the producer, but all will receive events.
+        if self._is_leader and message.value >= 21:
+            self.application.producer_stop.set()
 
 
-async def main():
-    # single-producer/multi-consumer
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ServerConfig:
+    port: int = 8082
+    host: str = "localhost"
+    log_level: str = "INFO"  # Startup messages and the status URL, per-value lines are DEBUG
 
-    @dataclass(frozen=True, slots=True, kw_only=True)
-    class ServerConfig:
-        port: int = 8082
-        host: str = "localhost"
 
+async def main():
+    # single-producer/multi-consumer
     config = ServerConfig()
     system = System(configuration=config)
-
-    # Attach components
-    system.attach(Producer(system))
-    system.attach(Consumer(system, name="Consumer-1"))
-    system.attach(Consumer(system, name="Consumer-2"))
+    # The mediator logs every dispatched message at INFO, keep it to warnings
+    logging.getLogger("nether.mediator").setLevel(logging.WARNING)
 
     server = Server(system, configuration=config)
-    system.attach(server)
 
-    # Add status registration component that will register the view after startup
-    system.attach(StatusRegistrationComponent(system, server))
+    # Attach all components at once, the status registration component
+    # registers the view after startup
+    system.attach(
+        Producer(system),
+        Consumer(system, name="Consumer-1", leader=True),
+        Consumer(system, name="Consumer-2"),
+        server,
+        StatusRegistrationComponent(system, server),
+    )
 
     await system.start()
 
 
 if __name__ == "__main__":
     try:
-        nether.execute(main())
+        nether.execute(main(), use_uvloop=True)
     except KeyboardInterrupt:
         print("Shutting down gracefully")
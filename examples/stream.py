@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from nether.system import Nether
+from nether.system import Nether, execute
 from nether.modules import Module
 from nether.message import Command, Event
 
@@ -248,4 +248,4 @@ if __name__ == "__main__":
     print("=" * 60)
     print()
 
-    asyncio.run(main())
+    execute(main(), use_uvloop=True)
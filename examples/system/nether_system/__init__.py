@@ -30,6 +30,7 @@ import argparse
 import asyncio
 import json
 import time
+from pathlib import Path
 from typing import Any
 
 import nether
@@ -37,6 +38,7 @@ from aiohttp import web
 from nether.modules import Module
 from nether.server import RegisterView, Server, ViewRegistered
 
+from .module._http import Broadcaster, Payload, cached_response
 from .module.analytics import AnalyticsModule
 from .module.dashboard import DashboardModule
 from .module.process import ProcessModule
@@ -48,38 +50,25 @@ from .module.settings import SettingsModule
 class ComponentRegistry:
     """Registry manages dynamic component discovery and lifecycle."""
 
+    HEARTBEAT_INTERVAL = 30.0
+
     def __init__(self):
         self.components: dict[str, Module] = {}
         self.manifests: dict[str, dict[str, Any]] = {}
-        self.sse_clients: set = set()  # Store SSE clients for live updates
+        # SSE clients for live updates, sent a shared heartbeat while connected
+        self.sse = Broadcaster(self.HEARTBEAT_INTERVAL, self._heartbeat_frame)
         self.background_tasks: set = set()  # Store background tasks
 
-    def add_sse_client(self, response):
-        """Add a new SSE client for component updates."""
-        self.sse_clients.add(response)
-
-    def remove_sse_client(self, response):
-        """Remove an SSE client."""
-        self.sse_clients.discard(response)
+    async def _heartbeat_frame(self) -> bytes:
+        """Heartbeat frame, sent to all SSE clients every HEARTBEAT_INTERVAL."""
+        return f"data: {json.dumps({'type': 'heartbeat', 'timestamp': time.time()})}\n\n".encode()
 
     async def notify_component_registered(
         self, component_id: str, manifest: dict[str, Any]
     ):
         """Notify all SSE clients about a new component registration."""
         message = f"data: {json.dumps({'type': 'component_registered', 'id': component_id, 'manifest': manifest})}\n\n"
-
-        # Send to all connected SSE clients
-        disconnected_clients = set()
-        for client in self.sse_clients:
-            try:
-                await client.write(message.encode())
-            except Exception:
-                # Client disconnected, mark for removal
-                disconnected_clients.add(client)
-
-        # Remove disconnected clients
-        for client in disconnected_clients:
-            self.sse_clients.discard(client)
+        await self.sse.broadcast(message.encode())
 
     def register_component(
         self, component_id: str, component: Module, manifest: dict[str, Any]
@@ -144,11 +133,11 @@ class APIDiscoveryView(web.View):
             # Find the server component to access HTTP routes
             server_component = None
             for component in app.mediator.modules:
-                if hasattr(component, "_http_server"):
+                if isinstance(component, Server):
                     server_component = component
                     break
 
-            if server_component and hasattr(server_component, "_http_server"):
+            if server_component is not None:
                 # Extract routes from aiohttp router
                 for resource in server_component._http_server.router.resources():
                     route_info = {
@@ -256,29 +245,42 @@ class ComponentSSEView(web.View):
         app = self.request.app.get("nether_app")
         if app and hasattr(app, "component_registry"):
             # Add this SSE client to the registry
-            app.component_registry.add_sse_client(response)
+            closed = app.component_registry.sse.add_client(response)
 
             # Send initial connection message
             initial_message = f"data: {json.dumps({'type': 'connected', 'message': 'SSE connection established'})}\n\n"
-            await response.write(initial_message.encode())
-
             try:
-                # Keep connection alive until client disconnects
-                while True:
-                    await asyncio.sleep(30)  # Send heartbeat every 30 seconds
-                    heartbeat = f"data: {json.dumps({'type': 'heartbeat', 'timestamp': time.time()})}\n\n"
-                    await response.write(heartbeat.encode())
+                await response.write(initial_message.encode())
+                # Keep connection alive until client disconnects; heartbeats
+                # are broadcast by the registry to all clients at once
+                await closed.wait()
             except Exception:
                 # Client disconnected or other error
                 pass
             finally:
                 # Remove client from registry when disconnected
-                if app and hasattr(app, "component_registry"):
-                    app.component_registry.remove_sse_client(response)
+                app.component_registry.sse.remove_client(response)
 
         return response
 
 
+# Stylesheet linked by the component views, read and compressed once at import
+_SHARED_CSS = Payload.build((Path(__file__).parent / "public" / "shared.css").read_bytes())
+
+
+class SharedCssView(web.View):
+    """Serve the stylesheet shared by the component views."""
+
+    async def get(self) -> web.Response:
+        return cached_response(
+            self.request,
+            _SHARED_CSS,
+            content_type="text/css",
+            charset="utf-8",
+            cache_control="public, max-age=86400",
+        )
+
+
 class ComponentManager(Module[RegisterView | ViewRegistered]):
     """Module to register SPA views and routes."""
 
@@ -292,7 +294,7 @@ class ComponentManager(Module[RegisterView | ViewRegistered]):
             # Get server component to access the HTTP app
             server = None
             for component in self.application.mediator.modules:
-                if hasattr(component, "_http_server"):
+                if isinstance(component, Server):
                     server = component
                     break
 
@@ -316,6 +318,7 @@ class ComponentManager(Module[RegisterView | ViewRegistered]):
                 await ctx.process(
                     RegisterView(route="/api/components/events", view=ComponentSSEView)
                 )
+                await ctx.process(RegisterView(route="/components/shared.css", view=SharedCssView))
 
             self.registered = True
             print("SPA routes registered")
@@ -684,9 +687,6 @@ class SystemView(web.View):
                     const response = await fetch(apiEndpoint);
                     const data = await response.json();
 
-                    const uptimeHours = Math.floor(data.uptime / 3600);
-                    const uptimeDisplay = `${Math.floor(uptimeHours / 24)}d ${uptimeHours % 24}h`;
-
                     contentDiv.innerHTML = `
                         <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0;">
                             <div style="background: white; padding: 15px; border-radius: 8px; border-left: 4px solid #27ae60;">
@@ -695,7 +695,9 @@ class SystemView(web.View):
                             </div>
                             <div style="background: white; padding: 15px; border-radius: 8px; border-left: 4px solid #3498db;">
                                 <div style="font-size: 0.9em; color: #7f8c8d; margin-bottom: 5px;">Uptime</div>
-                                <div style="font-size: 1.5em; font-weight: bold; color: #2c3e50;">${uptimeDisplay}</div>
+                                <div style="font-size: 1.5em; font-weight: bold; color: #2c3e50;">
+                                    ${data.uptime_display}
+                                </div>
                             </div>
                             <div style="background: white; padding: 15px; border-radius: 8px; border-left: 4px solid #e67e22;">
                                 <div style="font-size: 0.9em; color: #7f8c8d; margin-bottom: 5px;">Active Users</div>
@@ -750,10 +752,6 @@ class SystemView(web.View):
                     `;
                 }
 
-                // Calculate display values
-                const uptimeHours = Math.floor(dashboardData.uptime / 3600);
-                const uptimeDisplay = `${Math.floor(uptimeHours / 24)}d ${uptimeHours % 24}h`;
-
                 return `
                     <div class="component-header">
                         <h1 class="component-title">Dashboard (Direct Mode)</h1>
@@ -786,7 +784,7 @@ class SystemView(web.View):
                         </div>
                         <div class="metric-card" style="border-left: 4px solid #3498db;">
                             <div class="metric-label">Uptime</div>
-                            <div class="metric-value">${uptimeDisplay}</div>
+                            <div class="metric-value">${dashboardData.uptime_display}</div>
                         </div>
                         <div class="metric-card" style="border-left: 4px solid #e67e22;">
                             <div class="metric-label">Active Users</div>
@@ -804,21 +802,27 @@ class SystemView(web.View):
                             <div class="metric-label">Memory Usage</div>
                             <div class="metric-value">${dashboardData.memory_usage}%</div>
                             <div style="background: #ecf0f1; height: 8px; border-radius: 4px; margin-top: 10px;">
-                                <div style="background: ${dashboardData.memory_usage > 80 ? '#e74c3c' : dashboardData.memory_usage > 60 ? '#f39c12' : '#27ae60'}; height: 100%; width: ${dashboardData.memory_usage}%; border-radius: 4px; transition: width 0.3s;"></div>
+                                <div style="background: ${dashboardData.memory_bar_color}; height: 100%;
+                                            width: ${dashboardData.memory_usage}%; border-radius: 4px;
+                                            transition: width 0.3s;"></div>
                             </div>
                         </div>
                         <div class="metric-card">
                             <div class="metric-label">CPU Usage</div>
                             <div class="metric-value">${dashboardData.cpu_usage}%</div>
                             <div style="background: #ecf0f1; height: 8px; border-radius: 4px; margin-top: 10px;">
-                                <div style="background: ${dashboardData.cpu_usage > 80 ? '#e74c3c' : dashboardData.cpu_usage > 60 ? '#f39c12' : '#27ae60'}; height: 100%; width: ${dashboardData.cpu_usage}%; border-radius: 4px; transition: width 0.3s;"></div>
+                                <div style="background: ${dashboardData.cpu_bar_color}; height: 100%;
+                                            width: ${dashboardData.cpu_usage}%; border-radius: 4px;
+                                            transition: width 0.3s;"></div>
                             </div>
                         </div>
                         <div class="metric-card">
                             <div class="metric-label">Disk Usage</div>
                             <div class="metric-value">${dashboardData.disk_usage}%</div>
                             <div style="background: #ecf0f1; height: 8px; border-radius: 4px; margin-top: 10px;">
-                                <div style="background: ${dashboardData.disk_usage > 80 ? '#e74c3c' : dashboardData.disk_usage > 60 ? '#f39c12' : '#27ae60'}; height: 100%; width: ${dashboardData.disk_usage}%; border-radius: 4px; transition: width 0.3s;"></div>
+                                <div style="background: ${dashboardData.disk_bar_color}; height: 100%;
+                                            width: ${dashboardData.disk_usage}%; border-radius: 4px;
+                                            transition: width 0.3s;"></div>
                             </div>
                         </div>
                         <div class="metric-card">
@@ -830,12 +834,12 @@ class SystemView(web.View):
 
                     <!-- Performance Metrics -->
                     <div class="dashboard-grid">
-                        ${dashboardData.metrics.map(metric => `
+                        ${dashboardData.metric_names.map((name, i) => `
                             <div class="metric-card">
-                                <div class="metric-label">${metric.name}</div>
-                                <div class="metric-value">${metric.value}</div>
-                                <div class="metric-change" style="color: ${metric.trend === 'up' ? '#27ae60' : metric.trend === 'down' ? '#e74c3c' : '#f39c12'};">
-                                    ${metric.trend === 'up' ? '↗' : metric.trend === 'down' ? '↘' : '→'} ${metric.change}
+                                <div class="metric-label">${name}</div>
+                                <div class="metric-value">${dashboardData.metric_values[i]}</div>
+                                <div class="metric-change" style="color: ${dashboardData.metric_trend_colors[i]};">
+                                    ${dashboardData.metric_trend_glyphs[i]} ${dashboardData.metric_changes[i]}
                                 </div>
                             </div>
                         `).join('')}
@@ -1229,7 +1233,11 @@ class System(nether.Nether):
                     "route": "/dashboard",
                 },
                 "permissions": ["read:dashboard"],
-                "api_endpoints": ["/api/dashboard/data"],
+                "api_endpoints": [
+                    "/api/dashboard/data",
+                    "/api/dashboard/html",
+                    "/api/dashboard/stream",
+                ],
             },
         )
 
@@ -1248,7 +1256,7 @@ class System(nether.Nether):
                 "class_name": "AnalyticsWebComponent",
                 "routes": {
                     "api_base": "/api/analytics",
-                    "web_component": "/components/analytics",
+                    "web_component": "/components/analytics/analytics.html",
                     "module": "/modules/analytics.js",
                 },
                 "menu": {
@@ -1258,7 +1266,7 @@ class System(nether.Nether):
                     "route": "/analytics",
                 },
                 "permissions": ["read:analytics"],
-                "api_endpoints": ["/api/analytics/data"],
+                "api_endpoints": ["/api/analytics/data", "/api/analytics/html"],
             },
         )
 
@@ -1391,6 +1399,6 @@ async def run():
 
 def main():
     try:
-        nether.execute(run())
+        nether.execute(run(), use_uvloop=True)
     except KeyboardInterrupt:
         print("\nShutting down...")
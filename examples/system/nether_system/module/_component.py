@@ -0,0 +1,81 @@
+"""
+Base class for component modules that serve their own views.
+"""
+
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, ClassVar, override
+
+from aiohttp import web
+from nether.message import Message
+from nether.modules import Module
+from nether.server import AddStatic, AddStaticFailure, RegisterViews, StaticAdded
+
+__all__ = ["ComponentModule"]
+
+
+class ComponentModule[T: type[Message] | tuple[type[Message], ...]](Module[T]):
+    """Module that registers its declared views and static directories on start.
+
+    Subclasses declare `ROUTES` as (route, view) pairs and `STATIC` as
+    (prefix, directory) pairs. Routes are checked for clashes with other
+    components when the subclass is defined. Components with `STATIC` also
+    receive the `StaticAdded` / `AddStaticFailure` results; subclasses pass
+    messages they do not handle on to `super().handle`.
+    """
+
+    ROUTES: ClassVar[tuple[tuple[str, type[web.View]], ...]] = ()
+    STATIC: ClassVar[tuple[tuple[str, Path], ...]] = ()
+
+    # Route -> qualified name of the component class that declared it
+    _route_owners: ClassVar[dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        owners = ComponentModule._route_owners
+        owner = f"{cls.__module__}.{cls.__qualname__}"
+        claimed: set[str] = set()
+        for route, _ in cls.__dict__.get("ROUTES", ()):
+            if route in claimed or owners.get(route, owner) != owner:
+                raise ValueError(f"Route {route!r} is declared more than once")
+            claimed.add(route)
+        owners.update(dict.fromkeys(claimed, owner))
+
+    def __init__(self, application, *args, **kwargs) -> None:
+        super().__init__(application, *args, **kwargs)
+        self.registered = False
+
+    @property
+    @override
+    def supports(self) -> type[Message] | tuple[type[Message], ...]:
+        supports = super().supports
+        if not self.STATIC:
+            return supports
+        own = supports if isinstance(supports, tuple) else (supports,)
+        return (*own, StaticAdded, AddStaticFailure)
+
+    @override
+    async def on_start(self) -> None:
+        await super().on_start()
+        if not self.registered:
+            async with self.application.mediator.context() as ctx:
+                if self.ROUTES:
+                    await ctx.process(RegisterViews(routes=self.ROUTES))
+                for prefix, path in self.STATIC:
+                    await ctx.process(AddStatic(prefix=prefix, path=path))
+            self.registered = True
+            self._logger.debug("%s routes registered", type(self).__name__)
+
+    @override
+    async def handle(
+        self,
+        message: Any,
+        *,
+        handler: Callable[[Message], Awaitable[None]],
+        **_: Any,
+    ) -> None:
+        match message:
+            case AddStaticFailure(error=error):
+                self._logger.error("%s static directory not added: %s", type(self).__name__, error)
+            case StaticAdded():
+                pass
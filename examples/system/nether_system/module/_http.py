@@ -0,0 +1,198 @@
+"""
+Response helpers shared by the component modules.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import tempfile
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from aiohttp import hdrs, web
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+__all__ = ["Broadcaster", "Payload", "cached_response", "json_body", "spill"]
+
+_logger = logging.getLogger(__name__)
+
+# Content codings served from precompressed bodies, most preferred first
+_ENCODINGS = ("br", "gzip")
+
+# Suffixes of the precompressed siblings web.FileResponse looks for
+_ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Spilled payloads live here and are removed when the process exits
+_spill_dir: tempfile.TemporaryDirectory | None = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoder does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    def json_body(obj: Any) -> bytes:
+        """Serialize `obj` to JSON bytes."""
+        return orjson.dumps(obj, default=_json_default)
+
+else:
+
+    def json_body(obj: Any) -> bytes:
+        """Serialize `obj` to JSON bytes."""
+        return json.dumps(obj, default=_json_default).encode()
+
+
+@dataclass(frozen=True, slots=True)
+class Payload:
+    """A static response body with its entity tag and precompressed variants."""
+
+    body: bytes
+    etag: str
+    encoded: dict[str, bytes]
+
+    @classmethod
+    def build(cls, body: bytes) -> "Payload":
+        encoded = {"gzip": gzip.compress(body, 9)}
+        if brotli is not None:
+            encoded["br"] = brotli.compress(body, quality=11)
+        return cls(body, hashlib.sha256(body).hexdigest()[:16], encoded)
+
+
+def _qvalue(params: str) -> float:
+    """Return the `q` weight of an Accept-Encoding element, 1 when absent and 0 when malformed."""
+    for param in params.split(";"):
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def _accepted_encoding(request: web.Request, payload: Payload) -> str | None:
+    """Pick the precompressed variant the client weighs highest, if any.
+
+    Codings with q=0 are not acceptable; ties go to the order of `_ENCODINGS`.
+    """
+    header = request.headers.get(hdrs.ACCEPT_ENCODING, "")
+    weights: dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        weights[coding.strip().lower()] = _qvalue(params)
+    accepted = [encoding for encoding in _ENCODINGS if weights.get(encoding, 0) > 0 and encoding in payload.encoded]
+    return max(accepted, key=weights.__getitem__, default=None)
+
+
+def cached_response(
+    request: web.Request,
+    payload: Payload,
+    *,
+    content_type: str,
+    charset: str | None = None,
+    cache_control: str,
+) -> web.Response:
+    """Return `payload`, or an empty 304 if the client already holds it."""
+    encoding = _accepted_encoding(request, payload)
+    etag = payload.etag if encoding is None else f"{payload.etag}-{encoding}"
+    if any(tag.value in (etag, "*") for tag in request.if_none_match or ()):
+        response = web.Response(status=304)
+    elif encoding is None:
+        response = web.Response(body=payload.body, content_type=content_type, charset=charset)
+    else:
+        response = web.Response(
+            body=payload.encoded[encoding],
+            content_type=content_type,
+            charset=charset,
+            headers={hdrs.CONTENT_ENCODING: encoding},
+        )
+    response.etag = etag
+    response.headers[hdrs.CACHE_CONTROL] = cache_control
+    response.headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+    return response
+
+
+def spill(name: str, payload: Payload) -> Path:
+    """Write `payload` and its precompressed variants to a private temporary file.
+
+    Serving the returned path with `web.FileResponse` lets aiohttp use sendfile and
+    pick the variant matching the request's Accept-Encoding.
+    """
+    global _spill_dir
+    if _spill_dir is None:
+        _spill_dir = tempfile.TemporaryDirectory(prefix="nether-system-")
+    path = Path(_spill_dir.name) / name
+    path.write_bytes(payload.body)
+    for encoding, body in payload.encoded.items():
+        path.with_name(path.name + _ENCODING_SUFFIXES[encoding]).write_bytes(body)
+    return path
+
+
+class Broadcaster:
+    """Fan Server-Sent Events frames out to all connected clients.
+
+    While any client is connected, one shared task awaits `next_frame` every
+    `interval` seconds and writes the frame to all clients at once. Clients
+    whose write fails are dropped.
+    """
+
+    # Comment frame, written when no frame could be produced so closed clients are still noticed
+    KEEPALIVE = b": keepalive\n\n"
+
+    def __init__(self, interval: float, next_frame: Callable[[], Awaitable[bytes]]) -> None:
+        self.interval = interval
+        self.clients: dict[web.StreamResponse, asyncio.Event] = {}
+        self._next_frame = next_frame
+        self._task: asyncio.Task | None = None
+
+    def add_client(self, response: web.StreamResponse) -> asyncio.Event:
+        """Add a client, returning an event set once it has been dropped."""
+        closed = asyncio.Event()
+        self.clients[response] = closed
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return closed
+
+    def remove_client(self, response: web.StreamResponse) -> None:
+        """Remove a client and wake its handler."""
+        closed = self.clients.pop(response, None)
+        if closed is not None:
+            closed.set()
+
+    async def broadcast(self, frame: bytes) -> None:
+        """Write one encoded frame to all clients concurrently, dropping those that fail."""
+        clients = tuple(self.clients)
+        if not clients:
+            return
+        results = await asyncio.gather(*(client.write(frame) for client in clients), return_exceptions=True)
+        for client, result in zip(clients, results, strict=True):
+            if isinstance(result, Exception):
+                self.remove_client(client)
+
+    async def _run(self) -> None:
+        while self.clients:
+            await asyncio.sleep(self.interval)
+            try:
+                frame = await self._next_frame()
+            except Exception:
+                _logger.exception("Failed to produce the next SSE frame")
+                frame = self.KEEPALIVE
+            await self.broadcast(frame)
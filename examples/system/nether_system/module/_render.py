@@ -0,0 +1,21 @@
+"""
+HTML fragment rendering helpers shared by the component modules.
+"""
+
+import html
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+__all__ = ["escaped", "render_rows"]
+
+
+def escaped(row: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a copy of `row` with its string values HTML-escaped."""
+    return {key: html.escape(value) if isinstance(value, str) else value for key, value in row.items()}
+
+
+def render_rows(template: str, rows: Iterable[Mapping[str, Any]], **derived: Callable[[Mapping[str, Any]], Any]) -> str:
+    """Render `template` once per row, adding the `derived` per-row fields."""
+    if not derived:
+        return "".join(template.format_map(escaped(row)) for row in rows)
+    return "".join(template.format_map(escaped(row) | {key: fn(row) for key, fn in derived.items()}) for row in rows)
@@ -501,4 +501,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    execute(main())
+    execute(main(), use_uvloop=True)
@@ -129,6 +129,11 @@ class Mediator:
         """Get the set of registered components."""
         return self._modules
 
+    @property
+    def context_count(self) -> int:
+        """Get the number of currently attached contexts."""
+        return len(self._contexts)
+
     async def stop(self) -> None:
         """Stop all registered services and reset singleton state."""
         logger.info(f"{self.__class__.__name__} stopping")
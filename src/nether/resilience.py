@@ -17,7 +17,7 @@ class CircuitBreaker:
 
     def __enter__(self):
         if self.state == "OPEN":
-            if time.time() - self.last_failure_time > self.recovery_timeout:
+            if time.monotonic() - self.last_failure_time > self.recovery_timeout:
                 self.state = "HALF-OPEN"
                 print("Circuit is HALF-OPEN. Trying test call...")
             else:
@@ -34,7 +34,7 @@ class CircuitBreaker:
 
     def _record_failure(self):
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
         if self.failure_count >= self.failure_threshold:
             self.state = "OPEN"
             print("Circuit opened due to repeated failures!")
@@ -58,6 +58,11 @@ class RegisterView(Command):
     view: type[web.View]
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RegisterViews(Command):
+    routes: tuple[tuple[str, type[web.View]], ...]
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class ViewRegistered(SuccessEvent): ...
 
@@ -237,11 +242,11 @@ class _DynamicRouter:
                 if self.logger.isEnabledFor(logging.DEBUG):
                     self.logger.debug(f"Default handler served: {request.path} -> {response.status}")
                 return response
-            except web.HTTPNotFound:
-                # This is a 404 - log detailed information in DEBUG mode
-                if self.logger.isEnabledFor(logging.DEBUG):
+            except web.HTTPException as error:
+                # For a 404, log detailed information in DEBUG mode
+                if isinstance(error, web.HTTPNotFound) and self.logger.isEnabledFor(logging.DEBUG):
                     self._log_404_debug_info(request, resource_index)
-                raise  # Re-raise to let aiohttp handle the 404 response
+                raise  # Re-raise to let aiohttp build the response, e.g. 403/404 from the static handler
             except Exception:
                 traceback_details = traceback.format_exc()
                 self.logger.error(f"Internal server error for {request.method} {request.path}: {traceback_details}")
@@ -255,7 +260,9 @@ class _DynamicRouter:
             request.__dict__["_match_info"] = match_info
             del request.__dict__["_cache"]["match_info"]  # Force re-evaluate cached match_info
             new_handler = cast(type[web.View], match_info.handler)
-            if getattr(new_handler, request.method.lower(), None) is None:
+            # Static resources resolve to a plain handler coroutine rather than a view class
+            is_view = isinstance(new_handler, type) and issubclass(new_handler, web.View)
+            if is_view and getattr(new_handler, request.method.lower(), None) is None:
                 if self.logger.isEnabledFor(logging.DEBUG):
                     available_methods = [
                         m
@@ -272,6 +279,8 @@ class _DynamicRouter:
             if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"View {new_handler.__name__} served: {request.path} -> {response.status}")
             return response
+        except web.HTTPException:
+            raise  # e.g. 403/404 from the static handler, let aiohttp build the response
         except Exception:
             traceback_details = traceback.format_exc()
             self.logger.error(f"Error in view handler for {request.method} {request.path}: {traceback_details}")
@@ -319,7 +328,7 @@ class _DynamicRouter:
                 self.logger.debug(f"Similar registered paths: {similar_paths}")
 
 
-class Server(Module[StartServer | StopServer | RegisterView]):
+class Server(Module[StartServer | StopServer | RegisterView | RegisterViews | AddStatic]):
     def __init__(
         self,
         application,
@@ -498,6 +507,10 @@ class Server(Module[StartServer | StopServer | RegisterView]):
                 case RegisterView():
                     await self._add_view(route=message.route, view=message.view)
                     result_event = ViewRegistered()
+                case RegisterViews():
+                    for route, view in message.routes:
+                        await self._add_view(route=route, view=view)
+                    result_event = ViewRegistered()
                 case AddStatic():
                     await self._add_static(prefix=message.prefix, path=message.path, **message.kwargs)
                     result_event = StaticAdded()
@@ -515,7 +528,7 @@ class Server(Module[StartServer | StopServer | RegisterView]):
                         result_event = StopServerFailure(error=error)
         except Exception as error:
             match message:
-                case RegisterView():
+                case RegisterView() | RegisterViews():
                     result_event = RegisterViewFailure(error=error)
                 case AddStatic():
                     result_event = AddStaticFailure(error=error)
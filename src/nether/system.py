@@ -190,10 +190,23 @@ def log_configuration(
             logger.log(level, f"{full_name}: {argument_value}")
 
 
-def execute(coroutine):
+def execute(coroutine, *, use_uvloop: bool = False):
+    """Run `coroutine` to completion and return its result.
+
+    With `use_uvloop`, the coroutine runs on a uvloop event loop when uvloop is
+    installed; otherwise, and on Windows, the default event loop is used.
+    """
+    loop_factory = None
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    asyncio.run(coroutine)
+    elif use_uvloop:
+        try:
+            import uvloop
+        except ImportError:  # uvloop is optional, keep the default event loop
+            pass
+        else:
+            loop_factory = uvloop.new_event_loop
+    return asyncio.run(coroutine, loop_factory=loop_factory)
 
 
 class Environment:  # TODO
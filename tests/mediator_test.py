@@ -240,6 +240,16 @@ class TestContextManagement:
             result = await ctx.receive_result()
             assert result == event
 
+    @pytest.mark.asyncio
+    async def test_context_count(self, mediator):
+        """Test that attached contexts are counted while open"""
+        count = mediator.context_count
+
+        async with mediator.context():
+            assert mediator.context_count == count + 1
+
+        assert mediator.context_count == count
+
 
 class TestEventProduction:
     """Test event production and cascading message handling"""
@@ -0,0 +1,96 @@
+import argparse
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from nether.message import Message
+from nether.server import (
+    AddStatic,
+    RegisterViewFailure,
+    RegisterViews,
+    Server,
+    StaticAdded,
+    ViewRegistered,
+)
+
+
+@pytest.fixture
+def server():
+    return Server(None, configuration=argparse.Namespace(host="127.0.0.1", port=8080))
+
+
+@pytest.fixture
+async def client(server):
+    async with TestClient(TestServer(server._http_server)) as client:
+        yield client
+
+
+async def process(server: Server, message: Message) -> list[Message]:
+    events: list[Message] = []
+
+    async def handler(event: Message) -> None:
+        events.append(event)
+
+    await server.handle(message, handler=handler)
+    return events
+
+
+class HelloView(web.View):
+    async def get(self) -> web.Response:
+        return web.Response(text="hello")
+
+
+class GoodbyeView(web.View):
+    async def get(self) -> web.Response:
+        return web.Response(text="goodbye")
+
+
+VIEWS = (("/hello", HelloView), ("/goodbye", GoodbyeView))
+
+
+class TestRegisterViews:
+    async def test_views_served_before_start(self, server):
+        events = await process(server, RegisterViews(routes=VIEWS))
+        assert [type(event) for event in events] == [ViewRegistered]
+
+        async with TestClient(TestServer(server._http_server)) as client:
+            assert await (await client.get("/hello")).text() == "hello"
+            assert await (await client.get("/goodbye")).text() == "goodbye"
+
+    async def test_views_served_after_start(self, server, client):
+        events = await process(server, RegisterViews(routes=VIEWS))
+        assert [type(event) for event in events] == [ViewRegistered]
+
+        assert await (await client.get("/hello")).text() == "hello"
+        assert await (await client.get("/goodbye")).text() == "goodbye"
+
+    async def test_bad_view_fails(self, server):
+        events = await process(server, RegisterViews(routes=(("no-leading-slash", HelloView),)))
+        assert [type(event) for event in events] == [RegisterViewFailure]
+
+
+class TestDynamicStatic:
+    async def test_static_added_after_start(self, server, client, tmp_path):
+        (tmp_path / "index.html").write_text("<p>hello</p>")
+        assert server._http_server.frozen
+
+        events = await process(server, AddStatic(prefix="/assets", path=tmp_path))
+        assert [type(event) for event in events] == [StaticAdded]
+
+        response = await client.get("/assets/index.html")
+        assert response.status == 200
+        assert await response.text() == "<p>hello</p>"
+
+    async def test_static_errors_keep_their_status(self, server, client, tmp_path):
+        await process(server, AddStatic(prefix="/assets", path=tmp_path))
+
+        assert (await client.get("/assets")).status == 403
+        assert (await client.get("/assets/missing.html")).status == 404
+
+    async def test_static_errors_keep_their_status_before_start(self, server, tmp_path):
+        await process(server, AddStatic(prefix="/assets", path=tmp_path))
+
+        async with TestClient(TestServer(server._http_server)) as client:
+            assert (await client.get("/assets")).status == 403
+            assert (await client.get("/assets/missing.html")).status == 404
@@ -1 +1,34 @@
+import asyncio
+import sys
+import types
+
 import pytest
+
+from nether.system import execute
+
+
+async def loop_type() -> type[asyncio.AbstractEventLoop]:
+    return type(asyncio.get_running_loop())
+
+
+class UvloopLoop(asyncio.SelectorEventLoop): ...
+
+
+@pytest.fixture
+def uvloop(monkeypatch):
+    module = types.SimpleNamespace(new_event_loop=UvloopLoop)
+    monkeypatch.setitem(sys.modules, "uvloop", module)
+    return module
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uvloop is not used on Windows")
+class TestExecute:
+    def test_default_loop_without_opt_in(self, uvloop):
+        assert execute(loop_type()) is not UvloopLoop
+
+    def test_uvloop_on_opt_in(self, uvloop):
+        assert execute(loop_type(), use_uvloop=True) is UvloopLoop
+
+    def test_default_loop_when_uvloop_missing(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        assert execute(loop_type(), use_uvloop=True) is not UvloopLoop